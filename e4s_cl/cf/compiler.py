@@ -1,42 +1,44 @@
 """
 Determine what compiler vendor was used to compile a given binary, by checking the .comments ELF section
 """
+import mmap
+import struct
 from typing import Iterable
 from enum import IntEnum
 from pathlib import Path
 from elftools.elf.elffile import ELFFile
 from elftools.common.exceptions import ELFError
 from e4s_cl.logger import get_logger
-from e4s_cl.util import which
+from e4s_cl.util import file_cache, which
 
 LOGGER = get_logger(__name__)
 
 
-def _gnu_check(string: str) -> bool:
-    return 'GCC' in string
+def _gnu_check(comment: bytes) -> bool:
+    return b'GCC' in comment
 
 
-def _llvm_check(string: str) -> bool:
-    return 'clang' in string
+def _llvm_check(comment: bytes) -> bool:
+    return b'clang' in comment
 
 
-def _intel_check(_: str) -> bool:
+def _intel_check(_: bytes) -> bool:
     return False
 
 
-def _amd_check(string: str) -> bool:
-    return 'AMD' in string
+def _amd_check(comment: bytes) -> bool:
+    return b'AMD' in comment
 
 
-def _pgi_check(_: str) -> bool:
+def _pgi_check(_: bytes) -> bool:
     return False
 
 
-def _armclang_check(_: str) -> bool:
+def _armclang_check(_: bytes) -> bool:
     return False
 
 
-def _fujitsu_check(_: str) -> bool:
+def _fujitsu_check(_: bytes) -> bool:
     return False
 
 
@@ -71,45 +73,118 @@ VENDOR_BINARIES = {
     CompilerVendor.FUJITSU: ('fcc', 'FCC', 'frt'),
 }
 
-# ROCm-compiled binaries contained 'AMD', 'clang' and 'GCC'
-# Establishing an order for the checks is a simple way
-# of ensuring the right value is returned
-PRECENDENCE = [CompilerVendor.AMD, CompilerVendor.LLVM, CompilerVendor.GNU]
 
+# ELF identification and structure formats, indexed by the EI_CLASS and EI_DATA
+# values of the file's e_ident
+_ELF_MAGIC = b'\x7fELF'
+_ELF_IDENT_SIZE = 16
+_ELF_BYTE_ORDER = {1: '<', 2: '>'}
+_ELF_HEADER_FORMAT = {1: 'HHIIIIIHHHHHH', 2: 'HHIQQQIHHHHHH'}
+_ELF_SECTION_FORMAT = {1: 'IIIIIIIIII', 2: 'IIQQQQIIQQ'}
 
-def _get_comment(elf_file: Path) -> str:
+
+def _read_comment_mmap(elf_file: Path) -> bytes:
+    """
+    Read the .comment sections of an ELF file by mapping it in memory and
+    parsing the section headers only. Raises ValueError or struct.error if the
+    file cannot be parsed this way.
+    """
+    with open(elf_file, 'rb') as data, mmap.mmap(
+            data.fileno(), 0, access=mmap.ACCESS_READ) as image:
+        if image[:4] != _ELF_MAGIC:
+            raise ValueError("Missing ELF magic number")
+
+        if len(image) < _ELF_IDENT_SIZE:
+            raise ValueError("Truncated ELF identification")
+
+        try:
+            byte_order = _ELF_BYTE_ORDER[image[5]]
+            header_format = byte_order + _ELF_HEADER_FORMAT[image[4]]
+            section_format = byte_order + _ELF_SECTION_FORMAT[image[4]]
+        except KeyError as err:
+            raise ValueError("Unsupported ELF class or data encoding") from err
+
+        # e_shoff, e_shentsize, e_shnum, e_shstrndx
+        header = struct.unpack_from(header_format, image, _ELF_IDENT_SIZE)
+        shoff, shentsize, shnum, shstrndx = header[5], *header[10:13]
+
+        # Extended section numbering is left to pyelftools
+        if shoff and (not shnum or shstrndx >= shnum):
+            raise ValueError("Unsupported section numbering")
+
+        sections = [
+            struct.unpack_from(section_format, image, shoff + index * shentsize)
+            for index in range(shnum)
+        ]
+
+        comments = []
+        if sections:
+            # sh_offset of the section name string table
+            names = sections[shstrndx][4]
+
+            for name, _, _, _, offset, size, *_ in sections:
+                start = names + name
+                if image[start:image.find(b'\x00', start)] == b'.comment':
+                    comments.append(image[offset:offset + size])
+
+        return b'\x00'.join(comments)
+
+
+def _read_comment_elftools(elf_file: Path) -> bytes:
+    """
+    Read the .comment sections of an ELF file using pyelftools
+    """
+    with open(elf_file, 'rb') as data:
+        elf = ELFFile(data)
+        comment_sections = filter(lambda x: x.name == '.comment',
+                                  elf.iter_sections())
+        return b'\x00'.join(map(lambda x: x.data(), comment_sections))
+
+
+def _get_comment(elf_file: Path) -> bytes:
     """
     Returns the contents of the .comment sections of the ELF file passed as an argument
     """
     try:
-        with open(elf_file, 'rb') as data:
-            elf = ELFFile(data)
-            comment_sections = filter(lambda x: x.name == '.comment',
-                                      elf.iter_sections())
-            return ' - '.join(
-                map(lambda x: x.data().decode(), comment_sections))
+        try:
+            return _read_comment_mmap(elf_file)
+        except (ValueError, struct.error) as err:
+            LOGGER.debug("Falling back to pyelftools for file %s: %s",
+                         str(elf_file), str(err))
+
+        return _read_comment_elftools(elf_file)
     except (PermissionError, FileNotFoundError, IsADirectoryError,
             ELFError) as err:
         LOGGER.debug("Error reading comments of file %s: %s", str(elf_file),
                      str(err))
-        return ''
+        return b''
 
 
-def compiler_vendor(elf_file: Path) -> int:
+def _vendor(elf_file: Path) -> int:
     """
-    Returns a value from CompilerVendor according to the contents of the .comment section of a binary
+    Parse the .comment section of a binary and deduce its compiler vendor
     """
     comment = _get_comment(elf_file)
 
-    for vendor in PRECENDENCE:
-        check = CHECKS.get(vendor)
-        if check and check(comment):
-            return vendor
+    # ROCm-compiled binaries contain 'AMD', 'clang' and 'GCC': the order of
+    # the checks ensures the right value is returned
+    if _amd_check(comment):
+        return CompilerVendor.AMD
+    if _llvm_check(comment):
+        return CompilerVendor.LLVM
 
     # By default, return GNU
     return CompilerVendor.GNU
 
 
+@file_cache(maxsize=4096)
+def compiler_vendor(elf_file: Path) -> int:
+    """
+    Returns a value from CompilerVendor according to the contents of the .comment section of a binary
+    """
+    return _vendor(elf_file)
+
+
 def available_compilers() -> Iterable[int]:
     """Return a list of compiler identifiers for compilers found on the system"""
 
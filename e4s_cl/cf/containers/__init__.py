@@ -12,16 +12,21 @@ that posesses the following attributes:
         an image
     - CLASS: the class to use. The class' `run` method will be used when launching
         the container: refer to its docstring for details
+
+Backend modules are only imported when a container of their type is created.
+NAME, MIMES and DEBUG_BACKEND are read from the module's source beforehand,
+and thus must be assigned literal values.
 """
 
-import re
+import ast
 import sys
 import json
 from dataclasses import dataclass
 from importlib import import_module
+from importlib.util import find_spec
 from tempfile import TemporaryFile, NamedTemporaryFile
 from pathlib import Path
-from typing import Union, List, Tuple, Iterable, Optional
+from typing import Union, List, Iterable, Optional
 from sotools.dl_cache import cache_libraries, get_generator
 from e4s_cl.logger import get_logger, debug_mode
 from e4s_cl import (
@@ -32,12 +37,8 @@ from e4s_cl import (
     EXIT_FAILURE,
     config,
 )
-from e4s_cl.variables import ParentStatus
 from e4s_cl.util import (
     get_env,
-    json_loads,
-    path_contains,
-    run_e4scl_subprocess,
     walk_packages,
     which,
 )
@@ -46,6 +47,13 @@ from e4s_cl.error import ConfigurationError
 
 LOGGER = get_logger(__name__)
 
+# Fixed locations of the imported files in the container, created once as
+# they are requested for every bound library
+_SCRIPT_PATH = Path(CONTAINER_SCRIPT)
+_IMPORT_DIR = Path(CONTAINER_DIR)
+_IMPORT_LIBRARY_DIR = Path(CONTAINER_LIBRARY_DIR)
+_IMPORT_BINARY_DIR = Path(CONTAINER_BINARY_DIR)
+
 # List of available modules, accessible by their "executable" or cli tool names
 BACKENDS = {}
 
@@ -56,6 +64,9 @@ EXPOSED_BACKENDS = []
 # list of tuples containing (suffix, backend_name)
 MIMES = []
 
+# Backend names indexed by image suffix, built alongside MIMES
+MIME_INDEX = {}
+
 
 # pylint: disable=too-few-public-methods
 class FileOptions:
@@ -241,14 +252,18 @@ def _unrelative(string: str) -> Iterable[Path]:
         if part == '..':
             visited.add(Path(*path.parts[:i]).resolve())
 
-    for element in visited:
-        contained = False
-        for path in visited:
-            if path != element and path_contains(path, element):
-                contained = True
+    # Visit the paths from the shallowest to the deepest, keeping only the
+    # ones not contained in a path kept before. The checks are made on the
+    # paths' string forms, as every parent is a prefix ending before a '/'
+    kept = set()
+    for posix, element in sorted(((x.as_posix(), x) for x in visited),
+                                 key=lambda x: len(x[0])):
+        if any((posix[:index] or '/') in kept
+               for index, char in enumerate(posix[:-1]) if char == '/'):
+            continue
 
-        if not contained:
-            deps.add(element)
+        kept.add(posix)
+        deps.add(element)
 
     return deps
 
@@ -265,11 +280,19 @@ class Container:
         argument, the appropriate subclass will be returned.
         """
         module_name = BACKENDS.get(name)
-        if module_name:
-            module = sys.modules.get(module_name)
-        else:
+        if not module_name:
             raise BackendUnsupported(name)
 
+        module = sys.modules.get(module_name)
+        if module is None:
+            try:
+                module = import_module(module_name)
+            except ModuleNotFoundError as err:
+                raise BackendNotAvailableError(name) from err
+
+            if not assert_module(module):
+                raise BackendUnsupported(name)
+
         driver = object.__new__(module.CLASS)
 
         # If in debugging mode, print out the config before running
@@ -293,6 +316,11 @@ class Container:
         # User-set parameters
         # Files to bind: set(BoundFile)
         self._bound_files = set()
+        # Binds requested since the last access to bound, as tuples of
+        # strings: list((origin, destination, option))
+        self._pending_binds = []
+        # Valid binds, computed on access to bound: list(BoundFile)
+        self._bound_cache = None
         self.env = {}  # Environment
         self.ld_preload = []  # Files to put in LD_PRELOAD
         self.ld_lib_path = []  # Directories to put in LD_LIBRARY_PATH
@@ -305,19 +333,19 @@ class Container:
 
     @property
     def script(self):
-        return Path(CONTAINER_SCRIPT)
+        return _SCRIPT_PATH
 
     @property
     def import_dir(self):
-        return Path(CONTAINER_DIR)
+        return _IMPORT_DIR
 
     @property
     def import_library_dir(self):
-        return Path(CONTAINER_LIBRARY_DIR)
+        return _IMPORT_LIBRARY_DIR
 
     @property
     def import_binary_dir(self):
-        return Path(CONTAINER_BINARY_DIR)
+        return _IMPORT_BINARY_DIR
 
     def _executable(self) -> Optional[Path]:
         """
@@ -507,28 +535,46 @@ class Container:
         if not path:
             return
 
-        new_binds = set()
         if not dest:
             for _path in _unrelative(path):
-                new_binds.add(BoundFile(_path, _path, option))
+                self._pending_binds.append((str(_path), str(_path), option))
         else:
-            new_binds.add(BoundFile(Path(path), Path(dest), option))
+            self._pending_binds.append((str(path), str(dest), option))
+
+        self._bound_cache = None
 
-        for bind in new_binds:
-            self._bound_files = optimize_bind_addition(bind, self._bound_files)
+    def _merge_binds(self) -> None:
+        """
+        Add the pending binds to the bound file set. Duplicate requests are
+        dropped before running the optimization pass on the remaining ones.
+        """
+        for origin, destination, option in dict.fromkeys(self._pending_binds):
+            self._bound_files = optimize_bind_addition(
+                BoundFile(Path(origin), Path(destination), option),
+                self._bound_files)
+
+        self._pending_binds.clear()
 
     @property
     def bound(self):
-        for bound in self._bound_files:
-            if bound.origin.exists() and bound.destination.is_absolute():
-                yield bound
-            else:
-                LOGGER.warning(
-                    "Attempting to bind non-existing file: %(source)s to %(dest)s",
-                    {
-                        'source': bound.origin,
-                        'dest': bound.destination
-                    })
+        # The binds are checked once after every modification, to avoid
+        # repeating the checks and warnings when listing them again
+        if self._bound_cache is None:
+            self._merge_binds()
+            self._bound_cache = []
+
+            for bound in self._bound_files:
+                if bound.origin.exists() and bound.destination.is_absolute():
+                    self._bound_cache.append(bound)
+                else:
+                    LOGGER.warning(
+                        "Attempting to bind non-existing file: %(source)s to %(dest)s",
+                        {
+                            'source': bound.origin,
+                            'dest': bound.destination
+                        })
+
+        yield from self._bound_cache
 
     def bind_env_var(self, key, value):
         self.env.update({key: value})
@@ -582,15 +628,13 @@ class Container:
 
 
 def guess_backend(path):
-    suffix = Path(path).suffix
-
-    matches = list(filter(lambda x: x[0] == suffix, MIMES))
+    matches = MIME_INDEX.get(Path(path).suffix, ())
 
     # If we cannot associate a unique backend to a MIME
     if len(matches) != 1:
         return None
 
-    return matches[0][1]
+    return matches[0]
 
 
 def assert_module(_module) -> bool:
@@ -614,23 +658,63 @@ def assert_module(_module) -> bool:
     return True
 
 
+def _backend_metadata(module_name: str) -> Optional[dict]:
+    """
+    Read the literal values assigned at the top level of a backend module
+    without importing it. Returns None if the module cannot be found or if one
+    of its top-level imports is not available.
+    """
+    spec = find_spec(module_name)
+    if spec is None or not spec.origin:
+        return None
+
+    with open(spec.origin, 'r', encoding='utf-8') as source:
+        tree = ast.parse(source.read(), spec.origin)
+
+    metadata = {}
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            roots = [alias.name.split('.')[0] for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and not node.level:
+            roots = [node.module.split('.')[0]]
+        else:
+            roots = []
+
+        for root in roots:
+            if root not in sys.modules and find_spec(root) is None:
+                LOGGER.debug("Container module '%s' requires missing module %s",
+                             module_name, root)
+                return None
+
+        if (isinstance(node, ast.Assign) and len(node.targets) == 1
+                and isinstance(node.targets[0], ast.Name)):
+            try:
+                metadata[node.targets[0].id] = ast.literal_eval(node.value)
+            except ValueError:
+                continue
+
+    return metadata
+
+
 for _, _module_name, _ in walk_packages(__path__, prefix=__name__ + "."):
-    try:
-        import_module(_module_name)
-    except ModuleNotFoundError:
-        continue
+    _metadata = _backend_metadata(_module_name)
 
-    _module = sys.modules[_module_name]
+    if _metadata is None:
+        continue
 
-    if not assert_module(_module):
+    if 'NAME' not in _metadata:
+        LOGGER.warning(
+            "Container module '%s' is missing a required attribute: NAME; skipping ...",
+            _module_name)
         continue
 
     BACKENDS.update({
-        _module.NAME: _module_name,
+        _metadata['NAME']: _module_name,
     })
 
-    if not getattr(_module, 'DEBUG_BACKEND', False):
-        EXPOSED_BACKENDS.append(_module.NAME)
+    if not _metadata.get('DEBUG_BACKEND', False):
+        EXPOSED_BACKENDS.append(_metadata['NAME'])
 
-    for mimetype in getattr(_module, 'MIMES', []):
-        MIMES.append((mimetype, _module.NAME))
+    for mimetype in _metadata.get('MIMES', []):
+        MIMES.append((mimetype, _metadata['NAME']))
+        MIME_INDEX.setdefault(mimetype, []).append(_metadata['NAME'])
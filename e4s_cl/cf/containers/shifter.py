@@ -3,12 +3,14 @@ Module introducing shifter support
 """
 
 import os
-import subprocess
+import re
+import shutil
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import List, Tuple
 from e4s_cl import logger, CONTAINER_DIR
-from e4s_cl.util import run_subprocess, path_contains
+from e4s_cl.util import file_cache, run_subprocess, path_contains
 from e4s_cl.cf.containers import Container, FileOptions, BackendNotAvailableError
 
 LOGGER = logger.get_logger(__name__)
@@ -20,25 +22,22 @@ OPTION_STRINGS = {FileOptions.READ_ONLY: 'ro', FileOptions.READ_WRITE: 'rw'}
 
 _DEFAULT_CONFIG_PATH = Path('/etc/shifter/udiRoot.conf')
 
+# Number of threads used to copy files imported in CONTAINER_DIR
+_COPY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
 
-def _deprettify(lines):
+
+# Trailing backslashes and the line break they escape, along with the
+# surrounding horizontal whitespace
+_CONTINUATION_RE = re.compile(r'\\+[^\S\n]*\n[^\S\n]*')
+
+
+def _deprettify(text):
     """
     Reconstruct full directives out of directives separated by backslashes
     over multiple lines
     """
-    buffer, full_lines = '', []
-
-    for line in lines:
-        buffer = buffer + line
-
-        if buffer.endswith('\\'):
-            buffer = buffer.rstrip('\\')
-            continue
-
-        full_lines.append(buffer)
-        buffer = ''
-
-    return full_lines
+    joined = _CONTINUATION_RE.sub('', text)
+    return [line.strip() for line in joined.split('\n')]
 
 
 def _directives_to_dict(directives):
@@ -49,18 +48,19 @@ def _directives_to_dict(directives):
 
     # Split all the directives at the first '='
     for directive in directives:
-        parts = directive.split('=', 1)
+        key, separator, value = directive.partition('=')
 
-        if len(parts) != 2:
+        if not separator:
             LOGGER.debug("Shifter: udiRoot.conf: Unrecognized directive: '%s'",
                          directive)
             continue
 
-        entries.append(tuple(map(lambda x: x.strip(), parts)))
+        entries.append((key.strip(), value.strip()))
 
     return dict(entries)
 
 
+@file_cache(maxsize=8)
 def _parse_config(config_file: Path):
     """
     Parse a file at a given path and return a dict with its defined variables
@@ -68,20 +68,68 @@ def _parse_config(config_file: Path):
     # Read the given file
     try:
         with open(config_file, 'r', encoding='utf-8') as config:
-            config_directives = _deprettify(
-                [l.strip() for l in config.readlines()])
+            config_directives = _deprettify(config.read())
     except IOError as err:
         LOGGER.warning("Error opening configuration file: %s", str(err))
         return {}
 
-    # Remove all comments
-    config_directives = set(
-        filter(lambda x: not x.startswith('#'), config_directives))
+    # Remove all comments and empty lines, keeping the file's order so later
+    # definitions override earlier ones
+    config_directives = [
+        directive for directive in config_directives
+        if directive and not directive.startswith('#')
+    ]
 
     # Organize the results in a dict
     return _directives_to_dict(config_directives)
 
 
+def _flatten(source: Path, destination: Path) -> List[Tuple[Path, Path]]:
+    """
+    Prepare the copy of source to destination, in the manner of `cp -r`:
+    directories and symbolic links found in a source tree are created under
+    destination, and a list of (source, destination) pairs is returned for
+    the regular files left to copy
+    """
+    if not source.is_dir():
+        return [(source, destination)]
+
+    files = []
+
+    for root, dirnames, filenames in os.walk(source):
+        target = Path(destination, os.path.relpath(root, source))
+        os.makedirs(target, exist_ok=True)
+
+        # os.walk does not descend into symbolic links to directories; they
+        # are listed in dirnames and re-created like the other links
+        for name in [*dirnames, *filenames]:
+            origin = Path(root, name)
+
+            if origin.is_symlink():
+                try:
+                    os.symlink(os.readlink(origin), Path(target, name))
+                except OSError as err:
+                    LOGGER.warning("Shifter: Failed to copy '%s': %s",
+                                   origin.as_posix(), str(err))
+            elif name in filenames:
+                files.append((origin, Path(target, name)))
+
+    return files
+
+
+def _copy(source: Path, destination: Path) -> None:
+    """
+    Copy a file to destination. The import directory is mounted read-write,
+    so files are always copied to keep the host files out of reach; shutil
+    uses in-kernel copies (sendfile) on Linux when available.
+    """
+    try:
+        shutil.copy2(source, destination)
+    except OSError as err:
+        LOGGER.warning("Shifter: Failed to copy '%s' to '%s': %s",
+                       source.as_posix(), destination.as_posix(), str(err))
+
+
 class ShifterContainer(Container):
     """
     Class to use for a shifter execution
@@ -111,12 +159,49 @@ class ShifterContainer(Container):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.temp_dir = None
+        # Path to the shifter executable, resolved on the first run
+        self._executable_path = None
+        # Environment options, built on the first run after a modification
+        self._env_options = None
+
+    def bind_env_var(self, key, value):
+        super().bind_env_var(key, value)
+        self._env_options = None
+
+    def add_ld_preload(self, path):
+        super().add_ld_preload(path)
+        self._env_options = None
+
+    def add_ld_library_path(self, path):
+        super().add_ld_library_path(path)
+        self._env_options = None
+
+    def _environment_options(self) -> List[str]:
+        """
+        Translate the container environment into shifter options
+        """
+        if self._env_options is None:
+            env_list = []
+            if self.ld_preload:
+                env_list.append(
+                    f'--env=LD_PRELOAD={":".join(self.ld_preload)}')
+            if self.ld_lib_path:
+                env_list.append(
+                    f'--env=LD_LIBRARY_PATH={":".join(self.ld_lib_path)}')
+
+            env_list.extend(
+                f'--env={key}={value}' for key, value in self.env.items())
+
+            self._env_options = env_list
+
+        return self._env_options
 
     def _setup_import(self, where: Path) -> str:
         """
         Create a temporary directory to bind /.e4s-cl files in
         """
         volumes = [(where.as_posix(), CONTAINER_DIR)]
+        imports = []
 
         for file in self.bound:
             if path_contains(Path('/var'), file.destination):
@@ -131,12 +216,7 @@ class ShifterContainer(Container):
                 LOGGER.debug("Shifter: Creating %s for %s in %s",
                              temporary.as_posix(), file.origin.as_posix(),
                              file.destination.as_posix())
-                os.makedirs(temporary.parent, exist_ok=True)
-                with subprocess.Popen(
-                    ['cp', '-r',
-                     file.origin.as_posix(),
-                     temporary.as_posix()]) as proc:
-                    proc.wait()
+                imports.append((file.origin, temporary))
 
             elif file.origin.is_dir():
                 if file.destination.as_posix().startswith('/etc'):
@@ -152,19 +232,27 @@ class ShifterContainer(Container):
                     "Shifter: Failed to bind '%s': Backend does not support file"
                     "binding. Performance may be impacted.", file.origin)
 
-        return [f"--volume={source}:{dest}" for (source, dest) in volumes]
+        # Create the directories holding the imports once
+        for parent in {temporary.parent for (_, temporary) in imports}:
+            os.makedirs(parent, exist_ok=True)
 
-    def _prepare(self, command: List[str], overload: bool = True) -> List[str]:
-        env_list = []
-        if self.ld_preload:
-            env_list.append(f'--env=LD_PRELOAD={":".join(self.ld_preload)}')
-        if self.ld_lib_path:
-            env_list.append(
-                f'--env=LD_LIBRARY_PATH={":".join(self.ld_lib_path)}')
+        # Flatten the directories so the files of a large tree are spread
+        # across workers
+        copies = []
+        for origin, temporary in imports:
+            copies.extend(_flatten(origin, temporary))
 
-        for env_var in self.env.items():
-            env_list.append(f'--env={env_var}={env_var}')
+        # The copies are independent and spend most of their time in the
+        # kernel, run them concurrently
+        if copies:
+            with ThreadPoolExecutor(max_workers=_COPY_WORKERS) as executor:
+                list(executor.map(lambda pair: _copy(*pair), copies))
 
+        return [
+            '--volume=' + source + ':' + dest for (source, dest) in volumes
+        ]
+
+    def _prepare(self, command: List[str], overload: bool = True) -> List[str]:
         # The following is a variable linked to a directory created on the disk
         # Erasing this variable will erase the directory, thus the bind to self
         # pylint: disable=R1732
@@ -172,14 +260,20 @@ class ShifterContainer(Container):
         volumes = self._setup_import(Path(self.temp_dir.name))
         return [
             f"--image={self.image}",
-            *env_list,
+            *self._environment_options(),
             *volumes,
             *self._additional_options(),
             *command,
         ]
 
     def run(self, command: List[str], overload: bool = True) -> int:
-        executable = self._executable()
+        # Only check the previously resolved executable is still usable
+        # instead of walking the environment, configuration and $PATH again
+        if self._executable_path is None or not os.access(
+                self._executable_path, os.X_OK):
+            self._executable_path = self._executable()
+
+        executable = self._executable_path
         if executable is None:
             raise BackendNotAvailableError(self.__class__.__name__)
 
@@ -5,7 +5,7 @@ execution environment and allows for arbitrary code execution (e.g.
 library loading)
 """
 
-from os import chmod, unlink, pathsep
+from os import fchmod, unlink, pathsep
 from pathlib import Path
 from tempfile import NamedTemporaryFile
 from shlex import split
@@ -34,6 +34,9 @@ export LD_PRELOAD=%(preload)s${LD_PRELOAD:+:${LD_PRELOAD}}
 %(linker)s %(command)s
 """
 
+# Delimits the script in the debug output
+_SEPARATOR = "\n" + "=" * 80
+
 
 class Entrypoint:
     """
@@ -127,16 +130,20 @@ class Entrypoint:
         """
         Create a temporary file and print the script in it
         """
+        # Render the script once, as it may inspect the command on disk
+        rendered = str(self)
+
         with NamedTemporaryFile('w', delete=False) as script:
             self.file_name = script.name
-            script.write(str(self))
+            script.write(rendered)
 
-        chmod(self.file_name, 0o755)
+            # Set the permissions on the open descriptor rather than looking
+            # the file up again by path
+            fchmod(script.fileno(), 0o755)
 
-        sep = "\n" + "".join('=' for _ in range(80))
         LOGGER.debug("Running templated script:%(sep)s\n%(script)s%(sep)s", {
-            'sep': sep,
-            'script': str(self)
+            'sep': _SEPARATOR,
+            'script': rendered
         })
 
         return self.file_name
@@ -3,11 +3,13 @@ Module housing support for WI4MPI compatibility
 """
 
 import os
+import re
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 from functools import lru_cache
 from e4s_cl import logger
+from e4s_cl.util import file_cache
 from e4s_cl.cf.detect_mpi import MPIIdentifier, library_install_dir
 from e4s_cl.cf.containers import Container
 from e4s_cl.cf.launchers import filter_arguments, Parser
@@ -15,6 +17,9 @@ from e4s_cl.cf.launchers.mpirun import _wi4mpi_options
 
 LOGGER = logger.get_logger(__name__)
 
+# Per-user Wi4MPI configuration file, overriding the installation's
+USER_CONFIG_PATH = Path.home() / '.wi4mpi.cfg'
+
 
 @dataclass(frozen=True)
 class MPIFamily:
@@ -150,10 +155,15 @@ def wi4mpi_enabled() -> bool:
     return not os.environ.get("WI4MPI_VERSION") is None
 
 
-@lru_cache()
 def wi4mpi_root() -> Optional[Path]:
-    string = os.environ.get("WI4MPI_ROOT")
+    return _wi4mpi_root(os.environ.get("WI4MPI_ROOT"))
+
 
+@lru_cache(maxsize=32)
+def _wi4mpi_root(string: Optional[str]) -> Optional[Path]:
+    """
+    Memoized body of wi4mpi_root, keyed on the value of WI4MPI_ROOT
+    """
     if string is None or not string:
         LOGGER.debug("Getting Wi4MPI root failed")
         return None
@@ -161,32 +171,29 @@ def wi4mpi_root() -> Optional[Path]:
     return Path(string)
 
 
-def __read_cfg(cfg_file: Path) -> Dict[str, str]:
-    config = {}
+# Configuration directives of shape KEY=value or KEY="value", one per line.
+# Comments start with '#' and never match as the key excludes it. Only
+# horizontal whitespace is skipped, for a match to never span several lines
+_CFG_DIRECTIVE_RE = re.compile(
+    r'^[^\S\n]*([^#=\s]+)[^\S\n]*=[^\S\n]*"?([^"\n]*?)"?[^\S\n]*$',
+    re.MULTILINE)
+
 
+@file_cache(maxsize=16)
+def _read_cfg(cfg_file: Path) -> Dict[str, str]:
     try:
         with open(cfg_file, 'r', encoding='utf-8') as cfg:
-            for line in cfg.readlines():
-                line = line.strip()
-
-                if line.startswith('#') or not '=' in line:
-                    continue
-
-                key, value = line.split('=')
-
-                config.update({key: value.strip('"')})
-
+            return dict(_CFG_DIRECTIVE_RE.findall(cfg.read()))
     except OSError as err:
-        LOGGER.debug("Error accessing configuration %s: %s",
-                     cfg_file.as_posix(), str(err))
+        LOGGER.debug("Error accessing configuration %s: %s", str(cfg_file),
+                     str(err))
 
-    return config
+    return {}
 
 
-@lru_cache()
 def wi4mpi_config(install_dir: Path) -> Dict[str, str]:
-    global_cfg = __read_cfg(install_dir / 'etc' / 'wi4mpi.cfg')
-    user_cfg = __read_cfg(Path.home() / '.wi4mpi.cfg')
+    global_cfg = _read_cfg(Path(install_dir, 'etc', 'wi4mpi.cfg'))
+    user_cfg = _read_cfg(USER_CONFIG_PATH)
 
     global_cfg.update(user_cfg)
 
@@ -244,15 +251,24 @@ def wi4mpi_libraries(install_dir: Path) -> List[Path]:
                filter(None, [wrapper_lib, source_lib, target_lib])))
 
 
-def wi4mpi_libpath(install_dir: Path):
+def wi4mpi_libpath(install_dir: Path) -> Tuple[Path, ...]:
     """
     Select all WI4MPI-relevant elements from the LD_LIBRARY_PATH
     """
-    ld_library_path = os.environ.get('LD_LIBRARY_PATH', '').split(':')
+    return _wi4mpi_libpath(Path(install_dir).as_posix(),
+                           os.environ.get('LD_LIBRARY_PATH', ''))
 
-    for filename in ld_library_path:
-        if install_dir.as_posix() in filename:
-            yield Path(filename)
+
+@lru_cache(maxsize=8)
+def _wi4mpi_libpath(install_dir: str,
+                    ld_library_path: str) -> Tuple[Path, ...]:
+    """
+    Memoized body of wi4mpi_libpath, keyed on the installation path and the
+    value of LD_LIBRARY_PATH
+    """
+    return tuple(
+        Path(filename) for filename in ld_library_path.split(':')
+        if install_dir in filename)
 
 
 def wi4mpi_preload(install_dir: Path) -> List[str]:
@@ -5,6 +5,7 @@ CLI interface module
 import os
 import re
 import sys
+from functools import lru_cache
 from types import ModuleType
 from e4s_cl import E4S_CL_SCRIPT, EXIT_FAILURE
 from e4s_cl import logger, util
@@ -133,11 +134,14 @@ def command_from_module_name(module_name):
     return ' '.join(_command_as_list(module_name))
 
 
+@lru_cache(maxsize=16)
 def commands_next(package_name=COMMANDS_PACKAGE_NAME):
+    """Returns a sorted tuple of the sub-commands of a command package.
+    The command modules do not change at runtime, so the result is cached."""
     commands = sorted([
         i for i in _get_commands(package_name).items() if i[0] != '__module__'
     ])
-    return [cmd for cmd, _ in commands]
+    return tuple(cmd for cmd, _ in commands)
 
 
 def commands_description(package_name=COMMANDS_PACKAGE_NAME):
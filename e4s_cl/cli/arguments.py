@@ -615,6 +615,14 @@ def posix_path_list(string):
     return list(map(posix_path, string.split(',')))
 
 
+def path_list(string):
+    """Argument type callback.
+    Returns the list of paths in a comma-separated string, as given."""
+    return [
+        element.strip() for element in string.split(',') if element.strip()
+    ]
+
+
 def existing_posix_path(string):
     """
     Argument type callback.
@@ -245,8 +245,10 @@ class ExecuteCommand(AbstractCommand):
                             help="Container image to use",
                             metavar='image')
 
+        # The file list is normalized by the launch command, which builds
+        # this command line; split it without processing the paths again
         parser.add_argument('--files',
-                            type=arguments.posix_path_list,
+                            type=arguments.path_list,
                             help="Files to bind, comma-separated",
                             default=[],
                             metavar='files')
@@ -40,6 +40,24 @@ class MainCommand(AbstractCommand):
                          help_page_fmt=HELP_PAGE_FMT)
 
         self.command = os.path.basename(E4S_CL_SCRIPT)
+        self._option_strings = None
+        self._commands = None
+
+    @property
+    def commands(self):
+        """Set of the available sub-commands"""
+        if self._commands is None:
+            self._commands = frozenset(cli.commands_next())
+        return self._commands
+
+    @property
+    def option_strings(self):
+        """Set of the option strings accepted by the parser"""
+        if self._option_strings is None:
+            self._option_strings = frozenset(
+                util.flatten(
+                    map(lambda x: x.option_strings, self.parser.actions)))
+        return self._option_strings
 
     def _construct_parser(self):
         usage = f"{self.command} [arguments] <subcommand> [options]"
@@ -128,19 +146,15 @@ class MainCommand(AbstractCommand):
             logger.set_log_level('DEBUG')
 
         empty = len(argv) == 0
-        command = set(argv) & set(cli.commands_next())
-
-        # Get a list of valid option strings from the parser
-        option_strings = util.flatten(
-            map(lambda x: x.option_strings, self.parser.actions))
+        command = self.commands.intersection(argv)
 
         # If the error is not related to the omission of subcommand
         if not empty and not command:
             # Insert `launch` after any valid option string for e4s-cl
-            for arg in argv:
-                if arg in option_strings:
+            for index, arg in enumerate(argv):
+                if arg in self.option_strings:
                     continue
-                argv.insert(argv.index(arg), LAUNCH_COMMAND.monicker)
+                argv.insert(index, LAUNCH_COMMAND.monicker)
                 break
 
         LOGGER.debug("Parsing updated arguments '%s'", argv)
@@ -153,6 +167,11 @@ class MainCommand(AbstractCommand):
         and complete with 'launch' in case it misses a sub-command
         """
 
+        # A sub-command is present: parse directly, as any error would be
+        # reported as is below
+        if self.commands.intersection(argv):
+            return self._parse_args(argv)
+
         # Disable built-in error catching for this special case
         self.parser.exit_on_error = False
 
@@ -165,12 +184,8 @@ class MainCommand(AbstractCommand):
                 logger.set_log_level('DEBUG')
             LOGGER.debug("Argument parsing errored out with '%s'", argv)
 
-            # Check for the presence of a e4s-cl command
-            empty = len(argv) == 0
-            command = set(argv) & set(cli.commands_next())
-
             # If the error is not related to the omission of subcommand
-            if empty or command:
+            if len(argv) == 0:
                 # Snippet coming from Lib/argparse.py:1853
                 err = sys.exc_info()[1]
                 self.parser.error(str(err))
@@ -178,15 +193,11 @@ class MainCommand(AbstractCommand):
             # Disable error catching
             self.parser.exit_on_error = True
 
-            # Get a list of valid option strings from the parser
-            option_strings = util.flatten(
-                map(lambda x: x.option_strings, self.parser.actions))
-
             # Insert `launch` after any valid option string for e4s-cl
-            for arg in argv:
-                if arg in option_strings:
+            for index, arg in enumerate(argv):
+                if arg in self.option_strings:
                     continue
-                argv.insert(argv.index(arg), LAUNCH_COMMAND.monicker)
+                argv.insert(index, LAUNCH_COMMAND.monicker)
                 break
 
             LOGGER.debug("Parsing updated arguments '%s'", argv)
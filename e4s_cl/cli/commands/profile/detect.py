@@ -229,6 +229,11 @@ def detect_subprocesses(launcher, program):
     file_paths, library_paths = [], []
 
     for line in json_data.split('\n'):
+        # The data is sent as JSON objects: skip the program's output without
+        # parsing it
+        if not line.startswith('{'):
+            continue
+
         try:
             data = json_loads(line)
             file_paths.append(data['files'])
@@ -297,10 +302,13 @@ class ProfileDetectCommand(AbstractCliView):
         # interpret the output of children, or this is a child process, where
         # we just print data on stdout
         if not variables.is_parent():
-            print(json_dumps({
+            # The output of every child is read line by line by the parent;
+            # the compact separators keep the line, written at once, short
+            output = json_dumps({
                 'files': files,
-                'libraries': libs,
-            }))
+                'libraries': libs
+            }, separators=(',', ':'))
+            print(output, flush=True)
             return EXIT_SUCCESS
 
         return save_to_profile(args.profile_name, libs, files)
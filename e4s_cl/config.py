@@ -3,11 +3,12 @@
 Load and propagate the contents of configuration files in YAML format
 """
 
+import os
 import sys
-import yaml
 from dataclasses import dataclass
 from typing import List, Dict
 from pathlib import Path
+import yaml
 from e4s_cl import (
     CONTAINER_DIR,
     E4S_CL_HOME,
@@ -17,6 +18,12 @@ from e4s_cl import (
     WI4MPI_DEFAULT_INSTALL_DIR,
 )
 
+# Use the libyaml bindings when PyYAML was built with them
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 
 def update_configuration(configuration):
     global CONFIGURATION
@@ -129,7 +136,7 @@ class Configuration:
         """
 
         config = cls()
-        data = flatten(yaml.safe_load(string)) or {}
+        data = flatten(yaml.load(string, Loader=_SafeLoader)) or {}
 
         for parameter in ALLOWED_CONFIG.flatten():
             field = {}
@@ -153,7 +160,7 @@ class Configuration:
     @classmethod
     def create_from_file(cls, config_file, complete=False):
         yaml_contents = ''
-        if config_file and Path(config_file).exists():
+        if config_file and os.path.exists(config_file):
             with open(config_file, encoding='utf-8') as file:
                 yaml_contents = file.read()
 
@@ -13,7 +13,7 @@ a rotating debug file in the user's E4S CL directory, typically "~/.local/e4s_cl
 import os
 import re
 import sys
-import time
+import shutil
 import textwrap
 import socket
 import platform
@@ -21,6 +21,8 @@ import string
 import logging
 import hashlib
 import atexit
+import queue
+from functools import lru_cache
 from pathlib import Path
 from time import time
 from logging import handlers
@@ -45,115 +47,95 @@ get_logger = logging.getLogger
 WARNING = logging.WARNING
 ERROR = logging.ERROR
 
+_ANSI_RE = re.compile('\x1b[^m]+m')
+
 
 def _prune_ansi(line: str) -> str:
     """
     Remove ANSI color codes from a string
     """
-    return re.sub(re.compile('\x1b[^m]+m'), '', line)
+    # Most lines are not colored: avoid running the regex on those
+    if '\x1b' not in line:
+        return line
+    return _ANSI_RE.sub('', line)
 
 
-def get_terminal_size():
-    """Discover the size of the user's terminal.
-    
-    Several methods are attempted depending on the user's OS.
-    If no method succeeds then default to (80, 25).
-    
-    Returns:
-        tuple: (width, height) tuple giving the dimensions of the user's terminal window in characters.
+def _indent(text: str, header: str) -> str:
     """
-    default_width = 80
-    default_height = 25
-    dims = _get_term_size_env()
+    Prefix every line of text with header
+    """
+    if not header or not text:
+        return text
+    # No line follows a trailing newline
+    if text.endswith("\n"):
+        return header + text[:-1].replace("\n", "\n" + header) + "\n"
+    return header + text.replace("\n", "\n" + header)
 
-    if not dims:
-        dims = _get_term_size_posix()
 
-        if not dims:
-            dims = default_width, default_height
+@lru_cache(maxsize=64)
+def _header_length(header: str) -> int:
+    """
+    Length of a message header, pruned from invisible escape characters
+    """
+    return len(_prune_ansi(header))
 
-    try:
-        dims = list(map(int, dims))
-    except ValueError:
-        dims = default_width, default_height
 
-    width = dims[0] if dims[0] >= 10 else default_width
-    height = dims[1] if dims[1] >= 1 else default_height
+def get_terminal_size():
+    """Discover the size of the user's terminal.
 
-    return width, height
+    The COLUMNS and LINES environment variables take precedence, then the
+    terminals connected to the standard output and standard error are queried.
+    If no method succeeds then default to (80, 25).
 
-def _get_term_size_posix():
-    """Discover the size of the user's terminal on a POSIX operating system (e.g. Linux).
-    
     Returns:
-        tuple: (width, height) tuple giving the dimensions of the user's terminal window in characters,
-               or None if the size could not be determined.
+        tuple: (width, height) tuple giving the dimensions of the user's terminal window in characters.
     """
+    default_width = 80
+    default_height = 25
 
-    # This function follows a POSIX naming scheme, not Python's.
-    # pylint: disable=invalid-name
-    # Sometimes Pylint thinks termios doesn't exist or doesn't have certain members even when it does.
-    # pylint: disable=no-member
-    def ioctl_GWINSZ(fd):
-        try:
-            import fcntl
-            import termios
-            import struct
-            dims = struct.unpack('hh',
-                                 fcntl.ioctl(fd, termios.TIOCGWINSZ, '1234'))
-        except:  # pylint: disable=bare-except
-            return None
-        return dims
-
-    dims = ioctl_GWINSZ(0) or ioctl_GWINSZ(1) or ioctl_GWINSZ(2)
-    if not dims:
+    # Environment, then standard output; zeroes are returned on failure
+    width, height = shutil.get_terminal_size((0, 0))
+
+    # Messages are logged on the standard error: query its terminal when the
+    # standard output is redirected
+    if not (width and height):
         try:
-            fd = os.open(os.ctermid(), os.O_RDONLY)
-            dims = ioctl_GWINSZ(fd)
-            os.close(fd)
-        except:  # pylint: disable=bare-except
+            size = os.get_terminal_size(sys.stderr.fileno())
+            width, height = width or size.columns, height or size.lines
+        except (AttributeError, ValueError, OSError):
             pass
-    if not dims:
-        return None
-    return int(dims[1]), int(dims[0])
 
+    width = width if width >= 10 else default_width
+    height = height if height >= 1 else default_height
 
-def _get_term_size_env():
-    """Discover the size of the user's terminal via environment variables.
-    
-    The user may set the LINES and COLUMNS environment variables to control E4S CL's
-    console dimension calculations.
-    
-    Returns:
-        tuple: (width, height) tuple giving the dimensions of the user's terminal window in characters,
-               or None if the size could not be determined.
-    """
-    try:
-        return (int(os.environ['COLUMNS']), int(os.environ['LINES']))
-    except (KeyError, ValueError):
-        return None
+    return width, height
 
 
-def on_stdout(function):
+def _prune_colors(function, stream_color: bool):
+    """
+    Wrap a formatting method to remove color codes from its output when the
+    target stream does not support them. This is decided once, when the
+    method is decorated.
+    """
+    if stream_color:
+        return function
 
     def wrapper(obj, record):
         text = function(obj, record)
-        if STDOUT_COLOR:
+        # Formatters without colors do not emit escape sequences
+        if not obj.allow_colors:
             return text
         return _prune_ansi(text)
 
     return wrapper
 
 
-def on_stderr(function):
+def on_stdout(function):
+    return _prune_colors(function, STDOUT_COLOR)
 
-    def wrapper(obj, record):
-        text = function(obj, record)
-        if STDERR_COLOR:
-            return text
-        return _prune_ansi(text)
 
-    return wrapper
+def on_stderr(function):
+    return _prune_colors(function, STDERR_COLOR)
 
 
 class LogFormatter(logging.Formatter):
@@ -168,13 +150,15 @@ class LogFormatter(logging.Formatter):
     # Allow invalid function names to define member functions named after logging levels.
     # pylint: disable=invalid-name
 
-    _printable_chars = set(string.printable)
+    # Deletes all printable characters: what is left is unprintable
+    _printable_table = str.maketrans('', '', string.printable)
 
     def __init__(self, line_width=0, printable_only=False, allow_colors=True):
         super().__init__()
         self.printable_only = printable_only
         self.allow_colors = allow_colors
         self.line_width = line_width
+        self._text_wrappers = {}
 
     @on_stderr
     def CRITICAL(self, record):
@@ -200,9 +184,8 @@ class LogFormatter(logging.Formatter):
         """
         Print a debug message with a neat little header
         """
-        message = record.getMessage()
-        if self.printable_only and (not set(message).issubset(
-                self._printable_chars)):
+        message = record.message
+        if self.printable_only and message.translate(self._printable_table):
             message = "<<UNPRINTABLE>>"
 
         if __debug__:
@@ -216,6 +199,15 @@ class LogFormatter(logging.Formatter):
 
         return f"{marker} {message}"
 
+    # Formatting methods, indexed by level name
+    _level_formats = {
+        'CRITICAL': CRITICAL,
+        'ERROR': ERROR,
+        'WARNING': WARNING,
+        'INFO': INFO,
+        'DEBUG': DEBUG,
+    }
+
     def format(self, record):
         """Formats a log record.
         
@@ -228,11 +220,14 @@ class LogFormatter(logging.Formatter):
         Raises:
             RuntimeError: No format specified for a the record's logging level.
         """
-        try:
-            return getattr(self, record.levelname)(record)
-        except AttributeError as exc:
+        level_format = self._level_formats.get(record.levelname)
+        if level_format is None:
             raise RuntimeError(
-                f"Unknown record level (name: {record.levelname})") from exc
+                f"Unknown record level (name: {record.levelname})")
+
+        # Merge the arguments into the message once for all formatting methods
+        record.message = record.getMessage()
+        return level_format(self, record)
 
     def _colored(self, text, *color_args):
         """Insert ANSII color formatting via `termcolor`_.
@@ -272,29 +267,42 @@ class LogFormatter(logging.Formatter):
             return termcolor.colored(text, *color_args)
         return text
 
+    def _text_wrapper(self, width):
+        """
+        Return a TextWrapper for the given width, building it on first use
+        """
+        wrapper = self._text_wrappers.get(width)
+        if wrapper is None:
+            wrapper = textwrap.TextWrapper(width=width)
+            self._text_wrappers[width] = wrapper
+        return wrapper
+
     def _format_message(self, record, header=''):
-        # Length of the header, pruned from invisible escape characters
         if self.line_width:
-            header_length = len(_prune_ansi(header))
+            header_length = _header_length(header) if header else 0
 
             output = []
-            text = record.getMessage().split("\n")
+            text = record.message.split("\n")
 
             # Strip empty lines at the end only
             while len(text) > 1 and not text[-1]:
                 text.pop()
 
+            width = self.line_width - header_length
+            wrapper = self._text_wrapper(width)
+
             for line in text:
-                output += textwrap.wrap(line,
-                                        width=(self.line_width -
-                                               header_length))
                 if not line:
-                    output += ['']
+                    output.append('')
+                # Lines that fit and that the wrapper would leave untouched
+                elif (len(line) <= width and line.isprintable()
+                      and not line.endswith(' ')):
+                    output.append(line)
+                else:
+                    output.extend(wrapper.wrap(line))
 
-            return textwrap.indent("\n".join(output), header,
-                                   lambda line: True)
-        return textwrap.indent(record.getMessage().strip(), header,
-                               lambda line: True)
+            return _indent("\n".join(output), header)
+        return _indent(record.message.strip(), header)
 
 
 def set_log_level(level):
@@ -310,6 +318,8 @@ def set_log_level(level):
     global LOG_LEVEL
     LOG_LEVEL = level.upper()
     _STDERR_HANDLER.setLevel(LOG_LEVEL)
+    if not FILE_LOGGING:
+        _ROOT_LOGGER.setLevel(LOG_LEVEL)
 
 
 def debug_mode():
@@ -340,6 +350,35 @@ Uses system specific methods to determine console line width.  If the line
 width cannot be determined, the default is 80.
 """
 
+_BANNER_BAR = '#' * LINE_WIDTH
+
+_BANNER = ("\n%(bar)s\n"
+           "E4S CONTAINER LAUNCHER LOGGING INITIALIZED\n"
+           "\n"
+           "Timestamp         : %(timestamp)s\n"
+           "Hostname          : %(hostname)s\n"
+           "Platform          : %(platform)s\n"
+           "Version           : %(version)s\n"
+           "Python Version    : %(pyversion)s\n"
+           "Working Directory : %(cwd)s\n"
+           "Terminal Size     : %(termsize)s\n"
+           "Frozen            : %(frozen)s\n"
+           "Log ID            : %(logid)s\n"
+           "%(bar)s\n")
+"""Template of the debug message logged when logging is initialized"""
+
+_BUFFER_CAPACITY = 16
+"""Number of records buffered before being written to a log file"""
+
+FILE_LOGGING = False
+"""bool: True if the root logger writes records to a log file"""
+
+_PROCESS_LOGGERS = {}
+"""Dict of the loggers set up by :any:`setup_process_logger`"""
+
+_LISTENERS = []
+"""List of the queue listeners writing to log files"""
+
 LOG_ID_MARKER = "__E4S_CL_LOG_ID"
 """
 Environment variable name: set by the parent for every execution, is used to
@@ -350,8 +389,11 @@ group debug logs in folders
 def setup_process_logger(name: str) -> logging.Logger:
     """
     Create and setup handlers of a Logger object meant to log errors of
-    a subprocess
+    a subprocess. Loggers are set up once per name, then reused.
     """
+    process_logger = _PROCESS_LOGGERS.get(name)
+    if process_logger is not None:
+        return process_logger
 
     # Locate and ensure the log file directory is writeable
     # - Compatible with symlinks in LOG_ID
@@ -378,6 +420,7 @@ def setup_process_logger(name: str) -> logging.Logger:
         # everything on stderr
         process_logger.propagate = False
 
+    _PROCESS_LOGGERS[name] = process_logger
     return process_logger
 
 
@@ -416,17 +459,46 @@ def add_file_handler(
     if not is_available(log_file):
         return False
 
+    # The file is only opened when the first record is written
     file_handler = handlers.TimedRotatingFileHandler(log_file,
                                                      when='D',
                                                      interval=1,
-                                                     backupCount=3)
+                                                     backupCount=3,
+                                                     delay=True)
     file_handler.setFormatter(formatter)
     file_handler.setLevel(logging.DEBUG)
-    logger.addHandler(file_handler)
+
+    # Write to the file from a separate thread to avoid blocking the caller
+    # on I/O; the records are written in small batches, and warnings trigger
+    # a write to keep what matters on disk if the process is killed
+    records = queue.SimpleQueue()
+    listener = handlers.QueueListener(records,
+                                      handlers.MemoryHandler(
+                                          _BUFFER_CAPACITY,
+                                          flushLevel=logging.WARNING,
+                                          target=file_handler),
+                                      respect_handler_level=True)
+    logger.addHandler(handlers.QueueHandler(records))
+    listener.start()
+    _LISTENERS.append(listener)
 
     return True
 
 
+def _stop_listeners():
+    """
+    Process the records left in the queues and stop the listener threads
+    """
+    while _LISTENERS:
+        listener = _LISTENERS.pop()
+        listener.stop()
+        for handler in listener.handlers:
+            handler.flush()
+
+
+atexit.register(_stop_listeners)
+
+
 def update_symlink_latest():
     if Path(LOG_FILE.parent, LOG_ID).exists():
         try:
@@ -462,7 +534,7 @@ else:
 
 if is_parent():
     # Add a file handler, location depending on the status of the process
-    add_file_handler(LOG_FILE, _ROOT_LOGGER)
+    FILE_LOGGING = add_file_handler(LOG_FILE, _ROOT_LOGGER)
 
     # When running as e4s-cl
     if Path(sys.argv[0]).name == 'e4s-cl':
@@ -479,32 +551,30 @@ if is_parent():
         # at the end of the execution
         atexit.register(update_symlink_latest)
 
-    # pylint: disable=logging-not-lazy
-    _ROOT_LOGGER.debug(
-        ("\n%(bar)s\n"
-         "E4S CONTAINER LAUNCHER LOGGING INITIALIZED\n"
-         "\n"
-         "Timestamp         : %(timestamp)s\n"
-         "Hostname          : %(hostname)s\n"
-         "Platform          : %(platform)s\n"
-         "Version           : %(version)s\n"
-         "Python Version    : %(pyversion)s\n"
-         "Working Directory : %(cwd)s\n"
-         "Terminal Size     : %(termsize)s\n"
-         "Frozen            : %(frozen)s\n"
-         "Log ID            : %(logid)s\n"
-         "%(bar)s\n") % {
-             'bar': '#' * LINE_WIDTH,
-             'timestamp': str(datetime.now()),
-             'hostname': socket.gethostname(),
-             'platform': platform.platform(),
-             'version': E4S_CL_VERSION,
-             'pyversion': platform.python_version(),
-             'cwd': os.getcwd(),
-             'termsize': 'x'.join([str(_) for _ in TERM_SIZE]),
-             'frozen': getattr(sys, 'frozen', False),
-             'logid': LOG_ID,
-         })
+    # Gathering the platform information is costly: only do it if the
+    # banner is going to be output
+    if _ROOT_LOGGER.isEnabledFor(logging.DEBUG) and any(
+            handler.level <= logging.DEBUG
+            for handler in _ROOT_LOGGER.handlers):
+        _ROOT_LOGGER.debug(
+            _BANNER,
+            {
+                'bar': _BANNER_BAR,
+                'timestamp': str(datetime.now()),
+                'hostname': socket.gethostname(),
+                'platform': platform.platform(),
+                'version': E4S_CL_VERSION,
+                'pyversion': platform.python_version(),
+                'cwd': os.getcwd(),
+                'termsize': 'x'.join([str(_) for _ in TERM_SIZE]),
+                'frozen': getattr(sys, 'frozen', False),
+                'logid': LOG_ID,
+            })
 elif not CONFIGURATION.disable_ranked_log:
     _log_file = Path(_LOG_FILE_PREFIX, LOG_ID, f"e4s_cl.{os.getpid()}")
-    add_file_handler(_log_file, _ROOT_LOGGER)
+    FILE_LOGGING = add_file_handler(_log_file, _ROOT_LOGGER)
+
+# Without a log file, the records below the output level are discarded by the
+# handlers: filter them out before they are created
+if not FILE_LOGGING:
+    _ROOT_LOGGER.setLevel(LOG_LEVEL)
@@ -20,7 +20,8 @@ from typing import (
     Optional,
     Union,
 )
-from functools import lru_cache, reduce
+from copy import copy
+from functools import lru_cache, reduce, wraps
 from shutil import which as sh_which
 from collections import deque
 from tarfile import TarFile
@@ -86,6 +87,40 @@ def which(*args, **kwargs):
     return sh_which(*args, **kwargs)
 
 
+def file_cache(maxsize: int = 128):
+    """Memoize a function taking a file path as its only argument.
+
+    Entries are keyed on the resolved path, modification time and size of the
+    file, so they are invalidated when the file changes. Paths that cannot be
+    stat'ed are passed to the function without caching. A shallow copy of the
+    cached value is returned to keep it safe from the caller's modifications.
+    """
+
+    def decorator(function):
+
+        @lru_cache(maxsize=maxsize)
+        def cached(path: Path, _mtime_ns: int, _size: int):
+            return function(path)
+
+        @wraps(function)
+        def wrapper(path):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                return function(path)
+
+            return copy(
+                cached(Path(os.path.realpath(path)), stat.st_mtime_ns,
+                       stat.st_size))
+
+        wrapper.cache_info = cached.cache_info
+        wrapper.cache_clear = cached.cache_clear
+
+        return wrapper
+
+    return decorator
+
+
 def get_env(var: str) -> Optional[str]:
     """Check the environment for a variable. Automatically adds a prefix"""
     marker = f"{E4S_CL_ENV_PREFIX}_{var.upper()}"
@@ -1,6 +1,6 @@
 import re
 import tests
-from e4s_cl.cli.arguments import get_parser
+from e4s_cl.cli.arguments import get_parser, path_list, posix_path_list
 
 parser_usage = 'do not use'
 parser_description = 'This parser is a test'
@@ -38,3 +38,9 @@ class ArgumentsTests(tests.TestCase):
 
     def test_epilog(self):
         self.assertTrue(re.search(parser_epilog, self.help_string))
+
+    def test_path_list(self):
+        self.assertEqual(path_list('/usr/lib, /tmp/file,,'),
+                         ['/usr/lib', '/tmp/file'])
+        self.assertEqual(path_list(','.join(posix_path_list('/usr/./lib/'))),
+                         ['/usr/lib'])
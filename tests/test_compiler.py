@@ -0,0 +1,69 @@
+import struct
+import tests
+from shutil import copy
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from e4s_cl.cf.compiler import (
+    CompilerVendor,
+    _get_comment,
+    _read_comment_elftools,
+    _read_comment_mmap,
+    compiler_vendor,
+)
+
+LIBRARY = tests.ASSETS / 'libgver.so.0.0.0'
+
+
+class CompilerTest(tests.TestCase):
+
+    def setUp(self):
+        compiler_vendor.cache_clear()
+
+    def test_comment(self):
+        self.assertEqual(_read_comment_mmap(LIBRARY),
+                         _read_comment_elftools(LIBRARY))
+        self.assertIn(b'GCC', _get_comment(LIBRARY))
+
+    def test_comment_invalid(self):
+        with self.assertRaises(ValueError):
+            _read_comment_mmap(tests.ASSETS / 'e4s-cl.yaml')
+        self.assertEqual(_get_comment(tests.ASSETS / 'e4s-cl.yaml'), b'')
+
+    def test_comment_truncated(self):
+        with TemporaryDirectory() as directory:
+            for length in (4, 5, 6, 32):
+                truncated = Path(directory, f"truncated-{length}")
+                truncated.write_bytes(LIBRARY.read_bytes()[:length])
+
+                with self.assertRaises((ValueError, struct.error)):
+                    _read_comment_mmap(truncated)
+                self.assertEqual(_get_comment(truncated), b'')
+                self.assertEqual(compiler_vendor(truncated),
+                                 CompilerVendor.GNU)
+
+    def test_vendor(self):
+        self.assertEqual(compiler_vendor(LIBRARY), CompilerVendor.GNU)
+
+    def test_vendor_missing(self):
+        self.assertEqual(compiler_vendor(Path('/nonexistent/libfoo.so')),
+                         CompilerVendor.GNU)
+
+    def test_vendor_cache(self):
+        compiler_vendor(LIBRARY)
+        compiler_vendor(tests.ASSETS / 'libgver.so.0')
+
+        info = compiler_vendor.cache_info()
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.hits, 1)
+
+    def test_vendor_cache_invalidation(self):
+        with TemporaryDirectory() as directory:
+            library = Path(directory, LIBRARY.name)
+            copy(LIBRARY, library)
+
+            compiler_vendor(library)
+            with open(library, 'ab') as data:
+                data.write(b'\x00')
+            compiler_vendor(library)
+
+        self.assertEqual(compiler_vendor.cache_info().misses, 2)
@@ -2,8 +2,10 @@
 Assert basic configuration capabilities are supported
 """
 
+import os
 import tests
 import shlex
+from tempfile import NamedTemporaryFile
 from io import StringIO
 from pathlib import Path
 from unittest.mock import patch
@@ -73,6 +75,43 @@ launcher_options: 8"""
         self.assertEqual(getattr(c, 'b', None), 2)
         self.assertIsNone(getattr(c, 'c', None))
 
+    def test_file_update(self):
+        with NamedTemporaryFile('w', suffix='.yaml', delete=False) as config:
+            config.write("launcher_options: ['-n', '8']\n")
+            config_file = config.name
+
+        self.assertEqual(
+            Configuration.create_from_file(config_file).launcher_options,
+            ['-n', '8'])
+
+        with open(config_file, 'w') as config:
+            config.write("launcher_options: ['-n', '4']\n")
+
+        self.assertEqual(
+            Configuration.create_from_file(config_file).launcher_options,
+            ['-n', '4'])
+
+        os.unlink(config_file)
+
+    def test_file_lists(self):
+        with NamedTemporaryFile('w', suffix='.yaml', delete=False) as config:
+            config.write("launcher_options: ['-n', '8']\n")
+            config_file = config.name
+
+        first = Configuration.create_from_file(config_file)
+        first.launcher_options.append('--oversubscribe')
+
+        self.assertEqual(
+            Configuration.create_from_file(config_file).launcher_options,
+            ['-n', '8'])
+
+        os.unlink(config_file)
+
+    def test_missing_file(self):
+        self.assertEqual(
+            Configuration.create_from_file('/non/existing/file.yaml')._fields,
+            {})
+
     def test_assets(self):
         self.assertNotEqual(
             Configuration.create_from_file(tests.ASSETS / "e4s-cl.yaml"),
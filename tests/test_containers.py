@@ -1,11 +1,19 @@
 from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+import sys
 import tests
 from e4s_cl.cf.containers import (
+    BACKENDS,
+    MIME_INDEX,
     BackendUnsupported,
     BoundFile,
     Container,
     FileOptions,
+    guess_backend,
     optimize_bind_addition,
+    _backend_metadata,
+    _unrelative,
 )
 
 
@@ -20,6 +28,27 @@ class ContainerTest(tests.TestCase):
         with self.assertRaises(BackendUnsupported):
             container = Container(name='UNKNOWN')
 
+    def test_backend_metadata(self):
+        metadata = _backend_metadata('e4s_cl.cf.containers.singularity')
+        self.assertEqual(metadata.get('NAME'), 'singularity')
+        self.assertListEqual(metadata.get('MIMES'), ['.simg', '.sif'])
+
+        self.assertTrue(_backend_metadata('e4s_cl.cf.containers.dummy').get(
+            'DEBUG_BACKEND'))
+
+    def test_backend_lazy_import(self):
+        container = Container(name='dummy')
+        self.assertIs(type(container), sys.modules[BACKENDS['dummy']].CLASS)
+
+    def test_guess_backend(self):
+        with patch.dict(MIME_INDEX, {'.dmy': ['dummy']}):
+            self.assertEqual(guess_backend('/path/to/image.dmy'), 'dummy')
+
+        # Unknown suffixes and suffixes claimed by multiple backends
+        self.assertIsNone(guess_backend('/path/to/image.unknown'))
+        with patch.dict(MIME_INDEX, {'.dmy': ['dummy', 'other']}):
+            self.assertIsNone(guess_backend('/path/to/image.dmy'))
+
     def test_bind_file(self):
         container = Container(name='dummy')
 
@@ -58,6 +87,37 @@ class ContainerTest(tests.TestCase):
         self.assertIn(BoundFile(target, dest, FileOptions.READ_WRITE),
                       list(container.bound))
 
+    def test_bind_file_duplicates(self):
+        container = Container(name='dummy')
+
+        target = Path('/tmp')
+        dest = Path('/etc')
+
+        for _ in range(3):
+            container.bind_file(target, dest=dest)
+            container.bind_file(target.as_posix(), dest=dest.as_posix())
+
+        self.assertEqual(len(container._pending_binds), 6)
+        self.assertEqual(list(container.bound),
+                         [BoundFile(target, dest, FileOptions.READ_ONLY)])
+        self.assertFalse(container._pending_binds)
+
+    def test_bound_cache(self):
+        container = Container(name='dummy')
+        missing = Path('/non/existing/file')
+
+        container.bind_file(missing)
+        with self.assertLogs('e4s_cl.cf.containers', level='WARNING') as logs:
+            self.assertEqual(list(container.bound), [])
+            self.assertEqual(list(container.bound), [])
+            container.bind_file(Path('/tmp'))
+            self.assertEqual(list(container.bound),
+                             [BoundFile(Path('/tmp'), Path('/tmp'),
+                                        FileOptions.READ_ONLY)])
+
+        # One warning for the first listing, one after the new bind
+        self.assertEqual(len(logs.output), 2)
+
     def test_bind_file_inclusion(self):
         pmi = BoundFile(Path('/usr/lib/libpmi.so'), Path('/usr/lib/libpmi.so'),
                         FileOptions.READ_ONLY)
@@ -98,6 +158,18 @@ class ContainerTest(tests.TestCase):
 
         self.assertSetEqual({ref, file}, files)
 
+    def test_unrelative(self):
+        with TemporaryDirectory() as directory:
+            root = Path(directory).resolve()
+            for subdirectory in ['a/b', 'c', 'd']:
+                Path(root, subdirectory).mkdir(parents=True)
+
+            self.assertSetEqual(
+                _unrelative(f"{root}/a/b/../../c/../d"),
+                {root / 'a', root / 'c', root / 'd'},
+            )
+            self.assertSetEqual(_unrelative(f"{root}/a/b/.."), {root / 'a'})
+
     def test_double_bind(self):
         container = Container(name='dummy')
 
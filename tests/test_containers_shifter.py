@@ -1,6 +1,7 @@
-from os import getenv, getcwd, environ, pathsep
+from os import getenv, getcwd, environ, pathsep, utime
 from tempfile import NamedTemporaryFile, TemporaryDirectory
 from unittest import skipIf
+from unittest.mock import patch
 from pathlib import Path
 import tests
 from e4s_cl import config
@@ -55,6 +56,37 @@ class ContainerTestShifter(tests.TestCase):
         self.assertSetEqual(set(EXPECTED_CONFIG.values()),
                             set(directives.values()))
 
+    def test_parse_config_order(self):
+        with NamedTemporaryFile('w', delete=False) as config:
+            config.write(SAMPLE_CONFIG)
+            config.write("system=muller\n")
+            config_file = config.name
+
+        self.assertEqual(_parse_config(config_file).get('system'), 'muller')
+
+        Path(config_file).unlink()
+
+    def test_parse_config_cache(self):
+        with NamedTemporaryFile('w', delete=False) as config:
+            config.write(SAMPLE_CONFIG)
+            config_file = config.name
+
+        _parse_config.cache_clear()
+
+        directives = _parse_config(config_file)
+        directives['system'] = 'modified'
+        self.assertDictEqual(_parse_config(config_file), EXPECTED_CONFIG)
+        self.assertEqual(_parse_config.cache_info().hits, 1)
+
+        with open(config_file, 'a') as config:
+            config.write("newKey=value\n")
+        utime(config_file, ns=(0, 0))
+
+        self.assertEqual(_parse_config(config_file).get('newKey'), 'value')
+        self.assertEqual(_parse_config.cache_info().misses, 2)
+
+        Path(config_file).unlink()
+
     def test_create(self):
         container = Container(name='shifter', image='test')
         self.assertFalse(type(container) == Container)
@@ -64,13 +96,26 @@ class ContainerTestShifter(tests.TestCase):
         container = Container(name='shifter', image='imagenametest')
         command = ['']
         container_cmd = container._prepare(command)
-        self.assertIn('imagenametest', ' '.join(map(str, container_cmd)))
+        self.assertIn('imagenametest', ' '.join(container_cmd))
 
     def test_run_mpirun(self):
         container = Container(name='shifter', image='dummyimagename')
         command = ['mpirun -n 2 ls']
         container_cmd = container._prepare(command)
-        self.assertIn(command[0], ' '.join(map(str, container_cmd)))
+        self.assertIn(command[0], ' '.join(container_cmd))
+
+    def test_run_env(self):
+        container = Container(name='shifter', image='dummyimagename')
+        container.bind_env_var('TEST_VARIABLE', 'value')
+        container_cmd = container._prepare([''])
+        self.assertIn('--env=TEST_VARIABLE=value', container_cmd)
+
+        container.bind_env_var('TEST_VARIABLE', 'other')
+        container.add_ld_preload('/lib/libtest.so')
+        container_cmd = container._prepare([''])
+        self.assertIn('--env=TEST_VARIABLE=other', container_cmd)
+        self.assertIn('--env=LD_PRELOAD=/lib/libtest.so', container_cmd)
+        self.assertNotIn('--env=TEST_VARIABLE=value', container_cmd)
 
     def test_bind_file(self):
         container = Container(name='shifter')
@@ -148,6 +193,80 @@ class ContainerTestShifter(tests.TestCase):
 
         temp.cleanup()
 
+    def test_prepare_import_container_dir_tree(self):
+        """
+        Assert directories bound in CONTAINER_DIR are copied recursively
+        """
+        container = Container(name='shifter')
+        temp = TemporaryDirectory()
+        path = Path(temp.name)
+
+        source = Path(__file__).parent
+        container.bind_file(source,
+                            Path(container.import_library_dir) / source.name)
+
+        container._setup_import(path)
+
+        self.assertTrue(
+            Path(path, container.import_library_dir.name, source.name,
+                 Path(__file__).name).exists())
+
+        temp.cleanup()
+
+    def test_prepare_import_container_dir_links(self):
+        """
+        Assert symbolic links in directories bound in CONTAINER_DIR are kept
+        """
+        container = Container(name='shifter')
+        temp, tree = TemporaryDirectory(), TemporaryDirectory()
+        path, source = Path(temp.name), Path(tree.name)
+
+        Path(source, 'nested').mkdir()
+        Path(source, 'nested', 'file').write_text('contents')
+        Path(source, 'link').symlink_to('nested')
+
+        container.bind_file(source,
+                            Path(container.import_library_dir) / source.name)
+        container._setup_import(path)
+
+        copy = Path(path, container.import_library_dir.name, source.name)
+        self.assertEqual(Path(copy, 'nested', 'file').read_text(), 'contents')
+        self.assertTrue(Path(copy, 'link').is_symlink())
+        self.assertEqual(Path(copy, 'link', 'file').read_text(), 'contents')
+
+        temp.cleanup()
+        tree.cleanup()
+
+    def test_prepare_import_container_dir_copies(self):
+        """
+        Assert imports are copies, isolated from the host files
+        """
+        container = Container(name='shifter')
+        temp = TemporaryDirectory()
+        path = Path(temp.name)
+
+        source = Path(path, 'source')
+        source.write_text('contents')
+
+        container.bind_file(source,
+                            Path(container.import_binary_dir) / 'ro')
+        container.bind_file(source,
+                            Path(container.import_library_dir) / 'rw',
+                            option=FileOptions.READ_WRITE)
+        container._setup_import(Path(path, 'import'))
+
+        binaries = Path(path, 'import', container.import_binary_dir.name)
+        libraries = Path(path, 'import', container.import_library_dir.name)
+        for copy in [Path(binaries, 'ro'), Path(libraries, 'rw')]:
+            self.assertFalse(copy.samefile(source))
+            self.assertEqual(copy.read_text(), 'contents')
+
+        # Writes in the import directory do not reach the host
+        Path(binaries, 'ro').write_text('modified')
+        self.assertEqual(source.read_text(), 'contents')
+
+        temp.cleanup()
+
     def test_prepare_import_etc_files(self):
         """
         Assert importing /etc files fails
@@ -228,6 +347,20 @@ class ContainerTestShifter(tests.TestCase):
 
         environ['PATH'] = default_path
 
+    def test_run_executable_resolved_once(self):
+        """Assert the executable is resolved once per container"""
+        container = Container(name='shifter', image='dummyimagename')
+        executable = tests.ASSETS / 'bin' / 'shifter'
+
+        with patch.object(container, '_executable',
+                          return_value=executable) as resolve, patch(
+                              'e4s_cl.cf.containers.shifter.run_subprocess',
+                              return_value=0):
+            container.run([''])
+            container.run([''])
+
+        resolve.assert_called_once()
+
     def test_executable_config(self):
         """Assert the shifter executable is read from the configuration"""
         container = Container(name='shifter')
@@ -1,17 +1,24 @@
 from os import getcwd, environ, pathsep
-from unittest import skipIf
 from pathlib import Path
 import tests
 from e4s_cl import config
-from e4s_cl.util import which
 from e4s_cl.cf.containers import (
-    BackendUnsupported,
     BoundFile,
     Container,
     FileOptions,
 )
 
-CONFIG_EXECUTABLE = tests.ASSETS / 'bin' / 'singularity-conf'
+ASSETS_BIN = tests.ASSETS / 'bin'
+PATH_EXECUTABLE = ASSETS_BIN / 'singularity'
+CONFIG_EXECUTABLE = ASSETS_BIN / 'singularity-conf'
+ENV_EXECUTABLE = ASSETS_BIN / 'singularity-env'
+TMP = Path('/tmp')
+ETC = Path('/etc')
+SKEL = Path('/etc/skel')
+MEMINFO = Path('/proc/meminfo')
+TMP_RELATIVE = Path('/tmp/../proc/meminfo')
+HOME = Path.home()
+
 DEFAULT_CONFIGURATION = config.CONFIGURATION
 TEST_CONFIGURATION = config.Configuration.create_from_string(f"""
 backends:
@@ -24,81 +31,63 @@ backends:
 
 class ContainerTestSingularity(tests.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Only shared by read-only checks: _prepare modifies the container
+        cls.container = Container(name='singularity', image='imagenametest')
+
     def test_create(self):
-        container = Container(name='singularity', image='test')
-        self.assertFalse(type(container) == Container)
-        self.assertTrue(isinstance(container, Container))
+        self.assertFalse(type(self.container) == Container)
+        self.assertTrue(isinstance(self.container, Container))
 
     def test_run_image(self):
         container = Container(name='singularity', image='imagenametest')
         command = ['']
         container_cmd = container._prepare(command)
-        self.assertIn('imagenametest', ' '.join(map(str, container_cmd)))
+        self.assertIn('imagenametest', container_cmd)
 
     def test_run_pwd(self):
         container = Container(name='singularity')
         command = ['']
         container_cmd = container._prepare(command)
         pwd = getcwd()
-        self.assertIn(pwd, ' '.join(map(str, container_cmd)))
+        self.assertIn(pwd, container_cmd)
 
     def test_run_mpirun(self):
         container = Container(name='singularity', image='dummyimagename')
         command = ['mpirun -n 2 ls']
         container_cmd = container._prepare(command)
-        self.assertIn(command[0], ' '.join(map(str, container_cmd)))
+        self.assertIn(command[0], container_cmd)
 
     def test_bind_file(self):
         container = Container(name='singularity')
 
-        target = Path('/tmp')
-        dest = Path('/etc')
-        contained_dest = Path("/etc/skel")
-        option = FileOptions.READ_WRITE
-
-        container.bind_file(target)
-        self.assertIn(BoundFile(target, target, FileOptions.READ_ONLY),
-                      list(container.bound))
-
-        container._Container__bound_files = {}
-
-        container.bind_file(target, dest=dest)
-        self.assertIn(BoundFile(target, dest, FileOptions.READ_ONLY),
-                      list(container.bound))
-
-        container._Container__bound_files = {}
-
-        container.bind_file(target, dest=dest)
-        self.assertIn(BoundFile(target, dest, FileOptions.READ_ONLY),
-                      list(container.bound))
-
-        container.bind_file(target, dest=dest, option=option)
-        self.assertIn(BoundFile(target, dest, FileOptions.READ_WRITE),
-                      list(container.bound))
-
-        container._Container__bound_files = {}
-
-        container.bind_file(target, dest=contained_dest)
-        self.assertIn(BoundFile(target, contained_dest, FileOptions.READ_ONLY),
-                      list(container.bound))
-
-        container.bind_file(target, dest=dest, option=option)
-        self.assertIn(BoundFile(target, dest, FileOptions.READ_WRITE),
-                      list(container.bound))
+        # Binds are cumulative: each case is checked against the files bound
+        # by the previous ones
+        cases = [
+            (dict(), BoundFile(TMP, TMP, FileOptions.READ_ONLY)),
+            (dict(dest=ETC), BoundFile(TMP, ETC, FileOptions.READ_ONLY)),
+            (dict(dest=ETC), BoundFile(TMP, ETC, FileOptions.READ_ONLY)),
+            (dict(dest=ETC, option=FileOptions.READ_WRITE),
+             BoundFile(TMP, ETC, FileOptions.READ_WRITE)),
+            (dict(dest=SKEL), BoundFile(TMP, SKEL, FileOptions.READ_ONLY)),
+            (dict(dest=ETC, option=FileOptions.READ_WRITE),
+             BoundFile(TMP, ETC, FileOptions.READ_WRITE)),
+        ]
+
+        for kwargs, expected in cases:
+            with self.subTest(expected=expected):
+                container.bind_file(TMP, **kwargs)
+                self.assertIn(expected, set(container.bound))
 
     def test_bind_relative(self):
         container = Container(name='singularity')
 
-        target = Path('/tmp/../proc/meminfo')
-
-        ref = Path('/tmp')
-        file = Path('/proc/meminfo')
-        home = Path.home()
-
-        container.bind_file(target)
-        files = set(map(lambda x: x.origin, container.bound))
+        container.bind_file(TMP_RELATIVE)
+        files = {bound.origin for bound in container.bound}
 
-        self.assertSetEqual({ref, file, home}, files)
+        self.assertSetEqual({TMP, MEMINFO, HOME}, files)
 
     def test_additional_options_config(self):
         container = Container(name='singularity')
@@ -154,10 +143,9 @@ class ContainerTestSingularity(tests.TestCase):
         container = Container(name='singularity')
 
         default_path = environ.get('PATH', '')
-        environ['PATH'] = f"{tests.ASSETS / 'bin'}{pathsep}{default_path}"
+        environ['PATH'] = f"{ASSETS_BIN}{pathsep}{default_path}"
 
-        self.assertEqual(tests.ASSETS / 'bin' / 'singularity',
-                         container._executable())
+        self.assertEqual(PATH_EXECUTABLE, container._executable())
 
         environ['PATH'] = default_path
 
@@ -166,8 +154,7 @@ class ContainerTestSingularity(tests.TestCase):
         container = Container(name='singularity')
 
         config.update_configuration(TEST_CONFIGURATION)
-        self.assertEqual(tests.ASSETS / 'bin' / 'singularity-conf',
-                         container._executable())
+        self.assertEqual(CONFIG_EXECUTABLE, container._executable())
 
         config.update_configuration(DEFAULT_CONFIGURATION)
 
@@ -175,10 +162,8 @@ class ContainerTestSingularity(tests.TestCase):
         """Assert the singularity executable is read from the environment"""
         container = Container(name='singularity')
 
-        environ['E4S_CL_SINGULARITY_EXECUTABLE'] = str(tests.ASSETS / 'bin' /
-                                                       'singularity-env')
-        self.assertEqual(tests.ASSETS / 'bin' / 'singularity-env',
-                         container._executable())
+        environ['E4S_CL_SINGULARITY_EXECUTABLE'] = str(ENV_EXECUTABLE)
+        self.assertEqual(ENV_EXECUTABLE, container._executable())
 
         del environ['E4S_CL_SINGULARITY_EXECUTABLE']
 
@@ -187,25 +172,21 @@ class ContainerTestSingularity(tests.TestCase):
         container = Container(name='singularity')
 
         default_path = environ.get('PATH', '')
-        environ['PATH'] = f"{tests.ASSETS / 'bin'}{pathsep}{default_path}"
+        environ['PATH'] = f"{ASSETS_BIN}{pathsep}{default_path}"
         config.update_configuration(TEST_CONFIGURATION)
-        environ['E4S_CL_SINGULARITY_EXECUTABLE'] = str(tests.ASSETS / 'bin' /
-                                                       'singularity-env')
+        environ['E4S_CL_SINGULARITY_EXECUTABLE'] = str(ENV_EXECUTABLE)
 
-        self.assertEqual(tests.ASSETS / 'bin' / 'singularity-env',
-                         container._executable())
+        self.assertEqual(ENV_EXECUTABLE, container._executable())
 
         del environ['E4S_CL_SINGULARITY_EXECUTABLE']
 
-        self.assertEqual(tests.ASSETS / 'bin' / 'singularity-conf',
-                         container._executable())
+        self.assertEqual(CONFIG_EXECUTABLE, container._executable())
 
         config.update_configuration(DEFAULT_CONFIGURATION)
 
-        self.assertEqual(tests.ASSETS / 'bin' / 'singularity',
-                         container._executable())
+        self.assertEqual(PATH_EXECUTABLE, container._executable())
 
         environ['PATH'] = default_path
 
         # This fails as the which wrapper holds a cache
-        #self.assertNotEqual(tests.ASSETS / 'bin' / 'singularity', container._executable())
+        #self.assertNotEqual(PATH_EXECUTABLE, container._executable())
@@ -10,14 +10,18 @@ from e4s_cl.cli.commands.__execute import (import_library, filter_libraries,
                                            overlay_libraries, select_libraries,
                                            COMMAND)
 
+# Resolved once for all the tests: the linker cache does not change while the
+# tests run
+LIBMPI = linker.resolve("libmpi.so")
+
 
 class ExecuteTests(tests.TestCase):
 
-    @tests.skipIf(not linker.resolve("libmpi.so"), "No test library available")
+    @tests.skipIf(not LIBMPI, "No test library available")
     def test_lib_import(self):
         container = Container(name="containerless")
 
-        lib = Library.from_path(linker.resolve("libmpi.so"))
+        lib = Library.from_path(LIBMPI)
 
         import_library(lib, container)
 
@@ -28,7 +32,7 @@ class ExecuteTests(tests.TestCase):
 
         self.assertGreater(len(links), 1)
 
-    @tests.skipIf(not linker.resolve("libmpi.so"), "No test library available")
+    @tests.skipIf(not LIBMPI, "No test library available")
     def test_filter_libraries(self):
         lib_set = LibrarySet.create_from(["libmpi.so"])
 
@@ -38,11 +42,11 @@ class ExecuteTests(tests.TestCase):
 
         self.assertFalse(filtered.glib)
 
-    @tests.skipIf(not linker.resolve("libmpi.so"), "No test library available")
+    @tests.skipIf(not LIBMPI, "No test library available")
     def test_overlay_libraries(self):
         entry = Entrypoint()
         container = Container(name="containerless")
-        host_libraries = LibrarySet.create_from([linker.resolve("libmpi.so")])
+        host_libraries = LibrarySet.create_from([LIBMPI])
         host_bash = LibrarySet.create_from([which('bash')])
         lib_set = LibrarySet(host_libraries | host_bash)
 
@@ -54,19 +58,19 @@ class ExecuteTests(tests.TestCase):
             Path(entry.linker).name,
             Path(lib_set.linkers.pop().binary_path).name)
 
-    @tests.skipIf(not linker.resolve("libmpi.so"), "No test library available")
+    @tests.skipIf(not LIBMPI, "No test library available")
     def test_select_import_method(self):
         entry = Entrypoint()
         container = Container(name="containerless")
-        lib_set = LibrarySet.create_from([linker.resolve("libmpi.so")])
+        lib_set = LibrarySet.create_from([LIBMPI])
 
         self.assertTrue(select_libraries(lib_set, container, entry))
 
-    @tests.skipIf(not linker.resolve("libmpi.so"), "No test library available")
+    @tests.skipIf(not LIBMPI, "No test library available")
     def test_execute(self):
         set_dry_run(True)
 
-        libmpi = str(linker.resolve('libmpi.so'))
+        libmpi = str(LIBMPI)
 
         self.assertCommandReturnValue(0, COMMAND, [
             '--backend',
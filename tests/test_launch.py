@@ -12,6 +12,10 @@ from e4s_cl.cli.commands.launch import COMMAND
 from e4s_cl.cli.cli_view import CreateCommand
 from e4s_cl.model.profile import Profile
 
+# Profile to select when running the tests, read once from the environment
+TEST_PROFILE = os.getenv('__E4S_CL_TEST_PROFILE')
+TEST_PROFILE_DATA = json.loads(TEST_PROFILE) if TEST_PROFILE else None
+
 
 class LaunchTest(tests.TestCase):
 
@@ -23,33 +27,27 @@ class LaunchTest(tests.TestCase):
             CONFIGURATION_FILE)
         config.update_configuration(TEST_CONFIGURATION)
 
+        # The tests do not modify the profiles: create the test profile once
+        # for the whole class
+        cls.resetStorage()
+        if TEST_PROFILE_DATA:
+            controller = Profile.controller()
+            profile = controller.create(TEST_PROFILE_DATA)
+            controller.select(profile)
+
     @classmethod
     def tearDownClass(cls):
+        cls.resetStorage()
         config.update_configuration(config.Configuration.default())
 
-    def setUp(self):
-        self.resetStorage()
-
-        data = os.getenv('__E4S_CL_TEST_PROFILE', {})
-        if not data:
-            return
-
-        controller = Profile.controller()
-        profile = controller.create(json.loads(data))
-        controller.select(profile)
-
-    def tearDown(self):
-        self.resetStorage()
-
 
 def wrapper(launcher):
+    argv = shlex.split(
+        f"--backend containerless --image None {launcher} hostname")
 
     def generated(self):
         set_dry_run(True)
-        self.assertCommandReturnValue(
-            0, COMMAND,
-            shlex.split(
-                f"--backend containerless --image None {launcher} hostname"))
+        self.assertCommandReturnValue(0, COMMAND, argv)
 
     generated.__name__ = f"test_launch_{launcher}"
 
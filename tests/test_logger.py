@@ -0,0 +1,174 @@
+import tempfile
+import tests
+from unittest.mock import patch
+from pathlib import Path
+from e4s_cl import logger
+
+
+class LoggerTest(tests.TestCase):
+
+    def test_prune_ansi(self):
+        self.assertEqual(logger._prune_ansi('\x1b[1m\x1b[31mtext\x1b[0m'),
+                         'text')
+        self.assertEqual(logger._prune_ansi('text'), 'text')
+        self.assertEqual(logger._prune_ansi(''), '')
+
+    def test_header_length(self):
+        self.assertEqual(logger._header_length('[+] '), 4)
+        self.assertEqual(logger._header_length('\x1b[1m[+] \x1b[0m'), 4)
+
+    def test_format_message_wrap(self):
+        formatter = logger.LogFormatter(line_width=20)
+        record = logger.logging.LogRecord('test', logger.logging.INFO, '', 0,
+                                          'word ' * 10, None, None)
+
+        for _ in range(2):
+            output = formatter.format(record)
+            lines = output.split('\n')
+            self.assertTrue(all(len(line) <= 20 for line in lines))
+            self.assertTrue(all(line.startswith('[+] ') for line in lines))
+            self.assertEqual(output.count('word'), 10)
+
+        self.assertEqual(list(formatter._text_wrappers), [16])
+
+    def test_debug_printable_only(self):
+        formatter = logger.LogFormatter(printable_only=True,
+                                        allow_colors=False)
+
+        def _record(message):
+            return logger.logging.LogRecord('test', logger.logging.DEBUG, '',
+                                            0, message, None, None)
+
+        self.assertIn("multi\nline\ttext",
+                      formatter.format(_record("multi\nline\ttext")))
+        self.assertIn("<<UNPRINTABLE>>",
+                      formatter.format(_record("bell\x07")))
+
+    def test_no_colors(self):
+        formatter = logger.LogFormatter(allow_colors=False)
+        record = logger.logging.LogRecord('test', logger.logging.ERROR, '', 0,
+                                          'error', None, None)
+
+        self.assertNotIn('\x1b', formatter.format(record))
+
+    def _file_logger(self, name):
+        """
+        Create a logger writing to a temporary file through add_file_handler,
+        and return it along with the file and the listener writing to it
+        """
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+
+        log_file = Path(directory.name, 'log')
+        test_logger = logger.get_logger(name)
+        test_logger.propagate = False
+
+        self.assertTrue(logger.add_file_handler(log_file, test_logger))
+        listener = logger._LISTENERS.pop()
+
+        def _cleanup():
+            handler = test_logger.handlers[-1]
+            test_logger.removeHandler(handler)
+            handler.close()
+
+            if listener._thread is not None:
+                listener.stop()
+            for buffer in listener.handlers:
+                target = buffer.target
+                buffer.close()
+                target.close()
+
+        self.addCleanup(_cleanup)
+
+        return test_logger, log_file, listener
+
+    def test_add_file_handler(self):
+        test_logger, log_file, listener = self._file_logger(
+            'test_add_file_handler')
+        self.assertIsInstance(test_logger.handlers[-1],
+                              logger.handlers.QueueHandler)
+
+        test_logger.debug("queued message")
+
+        # Records are buffered until flushed
+        listener.stop()
+        self.assertNotIn("queued message", log_file.read_text())
+        listener.handlers[0].flush()
+
+        self.assertIn("queued message", log_file.read_text())
+
+    def test_add_file_handler_warning(self):
+        test_logger, log_file, listener = self._file_logger(
+            'test_add_file_handler_warning')
+
+        test_logger.debug("buffered message")
+        test_logger.warning("warning message")
+        listener.stop()
+
+        # Warnings write the buffered records without waiting for a flush
+        contents = log_file.read_text()
+        self.assertIn("buffered message", contents)
+        self.assertIn("warning message", contents)
+
+    def test_terminal_size(self):
+        with patch.dict('os.environ', {'COLUMNS': '132', 'LINES': '43'}):
+            self.assertEqual(logger.get_terminal_size(), (132, 43))
+
+        with patch.dict('os.environ', {'COLUMNS': '5', 'LINES': '43'}):
+            self.assertEqual(logger.get_terminal_size(), (80, 43))
+
+    def test_terminal_size_stderr(self):
+        # The standard output is redirected, the standard error is not
+        with patch('shutil.get_terminal_size', return_value=(0, 0)), patch(
+                'os.get_terminal_size',
+                return_value=logger.os.terminal_size((132, 43))):
+            self.assertEqual(logger.get_terminal_size(), (132, 43))
+
+        with patch('shutil.get_terminal_size', return_value=(0, 0)), patch(
+                'os.get_terminal_size', side_effect=OSError):
+            self.assertEqual(logger.get_terminal_size(), (80, 25))
+
+    def test_setup_process_logger(self):
+        process_logger = logger.setup_process_logger('process.test')
+        handlers = list(process_logger.handlers)
+
+        self.assertIs(logger.setup_process_logger('process.test'),
+                      process_logger)
+        self.assertEqual(process_logger.handlers, handlers)
+
+    def test_indent(self):
+        self.assertEqual(logger._indent('a\n\nb', '[+] '),
+                         '[+] a\n[+] \n[+] b')
+        self.assertEqual(logger._indent('a\nb', ''), 'a\nb')
+        self.assertEqual(logger._indent('', '[+] '), '')
+        self.assertEqual(logger._indent('a\n\n', '[+] '), '[+] a\n[+] \n')
+
+    def test_format_message_short_lines(self):
+        formatter = logger.LogFormatter(line_width=20)
+        record = logger.logging.LogRecord('test', logger.logging.INFO, '', 0,
+                                          'short\n\tindented \n', None,
+                                          None)
+
+        self.assertEqual(formatter.format(record),
+                         '[+] short\n[+]         indented')
+
+    def test_unknown_level(self):
+        formatter = logger.LogFormatter()
+        record = logger.logging.LogRecord('test', 5, '', 0, 'message', None,
+                                          None)
+
+        with self.assertRaises(RuntimeError):
+            formatter.format(record)
+
+    def test_set_log_level_no_file(self):
+        level = logger.LOG_LEVEL
+        root_level = logger._ROOT_LOGGER.level
+
+        try:
+            with patch.object(logger, 'FILE_LOGGING', False):
+                logger.set_log_level('WARNING')
+                self.assertFalse(
+                    logger.get_logger('test').isEnabledFor(logger.logging.INFO))
+        finally:
+            logger.set_log_level(level)
+            logger._ROOT_LOGGER.setLevel(root_level)
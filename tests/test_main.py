@@ -0,0 +1,39 @@
+import tests
+from e4s_cl import cli
+from unittest.mock import patch
+from e4s_cl.cli.commands.__main__ import COMMAND as main
+
+
+class MainTest(tests.TestCase):
+
+    def test_option_strings(self):
+        self.assertIn('--dry-run', main.option_strings)
+        self.assertIn('-v', main.option_strings)
+        self.assertIs(main.option_strings, main.option_strings)
+
+    def test_launch_insertion(self):
+        for parse in [main._py38_parse, main._py39_parse]:
+            args = parse(['-q', 'mpirun', '-np', '2', 'ls'])
+            self.assertEqual(args.command, 'launch')
+            self.assertEqual(args.options, ['mpirun', '-np', '2', 'ls'])
+
+    def test_command(self):
+        for parse in [main._py38_parse, main._py39_parse]:
+            args = parse(['-q', 'profile', 'list'])
+            self.assertEqual(args.command, 'profile')
+            self.assertEqual(args.options, ['list'])
+
+    def test_command_single_parse(self):
+        with patch.object(main, '_parse_args',
+                          wraps=main._parse_args) as parse_args:
+            main._py39_parse(['-q', 'profile', 'list'])
+
+        parse_args.assert_called_once()
+
+    def test_invalid_command(self):
+        with self.assertRaises(SystemExit):
+            main._py39_parse(['--unknown-option', 'profile', 'list'])
+
+    def test_commands(self):
+        self.assertIn('launch', main.commands)
+        self.assertIs(cli.commands_next(), cli.commands_next())
@@ -0,0 +1,21 @@
+import os
+import stat
+import tests
+from pathlib import Path
+from e4s_cl.cf.template import Entrypoint
+
+
+class TemplateTest(tests.TestCase):
+
+    def test_setup(self):
+        entry = Entrypoint()
+        entry.command = ['ls', '-l']
+
+        script = Path(entry.setup())
+
+        self.assertTrue(os.access(script, os.X_OK))
+        self.assertEqual(stat.S_IMODE(script.stat().st_mode), 0o755)
+        self.assertEqual(script.read_text(), str(entry))
+
+        entry.teardown()
+        self.assertFalse(script.exists())
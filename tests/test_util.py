@@ -3,7 +3,7 @@ import tempfile
 import tarfile
 from pathlib import Path
 import tests
-from e4s_cl.util import which, path_accessible, safe_tar
+from e4s_cl.util import which, file_cache, path_accessible, safe_tar
 
 
 class UtilTest(tests.TestCase):
@@ -14,6 +14,30 @@ class UtilTest(tests.TestCase):
         self.assertTrue(executable.is_absolute())
         return executable.as_posix()
 
+    def test_file_cache(self):
+
+        @file_cache(maxsize=4)
+        def read_lines(path):
+            return Path(path).read_text().splitlines()
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory, 'file')
+            path.write_text("first\n")
+
+            # Returned values are copies of the cached ones
+            read_lines(path).append("second")
+            self.assertEqual(read_lines(Path(directory, '.', 'file')),
+                             ['first'])
+            self.assertEqual(read_lines.cache_info().hits, 1)
+
+            path.write_text("first\nsecond\n")
+            os.utime(path, ns=(0, 0))
+            self.assertEqual(read_lines(path), ['first', 'second'])
+            self.assertEqual(read_lines.cache_info().misses, 2)
+
+        with self.assertRaises(FileNotFoundError):
+            read_lines(path)
+
     @tests.skipIf("CICD" in os.environ, "gitlab testing environment")
     def test_access(self):
         self.assertTrue(path_accessible('/tmp', 'r'))
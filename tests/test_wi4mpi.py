@@ -1,15 +1,129 @@
+import os
 import tests
 import shlex
 from pathlib import Path
 from tempfile import TemporaryDirectory, NamedTemporaryFile
 from e4s_cl.cf.detect_mpi import MPIIdentifier
-from e4s_cl.cf.wi4mpi import (wi4mpi_adapt_arguments)
+from e4s_cl.cf.wi4mpi import (
+    _read_cfg,
+    _wi4mpi_libpath,
+    _wi4mpi_root,
+    wi4mpi_adapt_arguments,
+    wi4mpi_config,
+    wi4mpi_libpath,
+    wi4mpi_root,
+)
 from e4s_cl.cf.wi4mpi.install import (WI4MPI_RELEASE_URL, _download_wi4mpi,
                                       _update_config)
 
 
 class Wi4MPITest(tests.TestCase):
 
+    def tearDown(self):
+        _read_cfg.cache_clear()
+        _wi4mpi_libpath.cache_clear()
+        _wi4mpi_root.cache_clear()
+
+    def test_root(self):
+        previous = os.environ.pop('WI4MPI_ROOT', None)
+
+        self.assertIsNone(wi4mpi_root())
+
+        os.environ['WI4MPI_ROOT'] = '/path/to/wi4mpi'
+        self.assertEqual(wi4mpi_root(), Path('/path/to/wi4mpi'))
+
+        del os.environ['WI4MPI_ROOT']
+        if previous is not None:
+            os.environ['WI4MPI_ROOT'] = previous
+
+    def test_config(self):
+        with TemporaryDirectory() as install_dir:
+            Path(install_dir, 'etc').mkdir()
+            Path(install_dir, 'etc', 'wi4mpi.cfg').write_text(
+                '# Comment\nMPICH_DEFAULT_ROOT="/path/to/mpich"\n')
+
+            config = wi4mpi_config(Path(install_dir))
+            self.assertEqual(config.get('MPICH_DEFAULT_ROOT'),
+                             '/path/to/mpich')
+
+            # Equivalent paths share the same cache entry
+            config['MPICH_DEFAULT_ROOT'] = 'modified'
+            self.assertEqual(
+                wi4mpi_config(Path(install_dir, 'etc',
+                                   '..')).get('MPICH_DEFAULT_ROOT'),
+                '/path/to/mpich')
+            self.assertEqual(_read_cfg.cache_info().hits, 1)
+
+    def test_config_parsing(self):
+        with TemporaryDirectory() as install_dir:
+            config_file = Path(install_dir, 'etc', 'wi4mpi.cfg')
+            config_file.parent.mkdir()
+            config_file.write_text("""# Comment="value"
+MPICH_DEFAULT_ROOT="/path/to/mpich"
+  OPENMPI_DEFAULT_ROOT = /path/to/openmpi  
+WI4MPI_OPTIONS="-a=b"
+not a directive
+""")
+
+            self.assertEqual(
+                wi4mpi_config(Path(install_dir)), {
+                    'MPICH_DEFAULT_ROOT': '/path/to/mpich',
+                    'OPENMPI_DEFAULT_ROOT': '/path/to/openmpi',
+                    'WI4MPI_OPTIONS': '-a=b',
+                })
+
+    def test_config_parsing_lines(self):
+        with TemporaryDirectory() as install_dir:
+            config_file = Path(install_dir, 'etc', 'wi4mpi.cfg')
+            config_file.parent.mkdir()
+
+            # Empty values and split directives never use the next line
+            config_file.write_text("EMPTY=\nNEXT=value\n\n"
+                                   "LAST=\n\n# comment\n"
+                                   "SPLIT\n=value\n")
+
+            self.assertEqual(wi4mpi_config(Path(install_dir)), {
+                'EMPTY': '',
+                'NEXT': 'value',
+                'LAST': '',
+            })
+
+    def test_config_file_cache(self):
+        with TemporaryDirectory() as install_dir:
+            config_file = Path(install_dir, 'etc', 'wi4mpi.cfg')
+            config_file.parent.mkdir()
+            config_file.write_text('MPICH_DEFAULT_ROOT="/path/to/mpich"\n')
+
+            wi4mpi_config(Path(install_dir))
+            wi4mpi_config(Path(install_dir))
+            self.assertEqual(_read_cfg.cache_info().hits, 1)
+
+            config_file.write_text('MPICH_DEFAULT_ROOT="/other/path"\n')
+            os.utime(config_file, ns=(0, 0))
+
+            self.assertEqual(
+                wi4mpi_config(Path(install_dir)).get('MPICH_DEFAULT_ROOT'),
+                '/other/path')
+            self.assertEqual(_read_cfg.cache_info().misses, 2)
+
+    def test_libpath(self):
+        previous = os.environ.get('LD_LIBRARY_PATH')
+        install_dir = Path('/path/to/wi4mpi')
+
+        os.environ['LD_LIBRARY_PATH'] = ':'.join(
+            ['/usr/lib', '/path/to/wi4mpi/lib', '/path/to/wi4mpi/libexec'])
+        self.assertEqual(
+            wi4mpi_libpath(install_dir),
+            (Path('/path/to/wi4mpi/lib'), Path('/path/to/wi4mpi/libexec')))
+
+        os.environ['LD_LIBRARY_PATH'] = '/usr/lib'
+        self.assertEqual(wi4mpi_libpath(install_dir), ())
+
+        if previous is None:
+            del os.environ['LD_LIBRARY_PATH']
+        else:
+            os.environ['LD_LIBRARY_PATH'] = previous
+
     def test_update_config(self):
         with NamedTemporaryFile(mode='w', delete=False) as config:
             config_file = config.name